@@ -40,14 +40,22 @@ USER_AGENT = (
 
 REQUEST_DELAY_MIN = 3  # 隨機間隔下限（秒）
 REQUEST_DELAY_MAX = 6  # 隨機間隔上限（秒）
+REQUEST_BURST = 2  # 閒置後允許連續發出的請求數（長期平均頻率仍由上面的間隔決定）
 REQUEST_TIMEOUT = 30  # 請求逾時（秒）
 REQUEST_MAX_RETRIES = 3  # 被擋時最多重試次數
+REQUEST_MAX_CONNECTIONS = 32  # 連線池上限
+REQUEST_MAX_KEEPALIVE = 4  # 保持 keep-alive 的閒置連線數（全部都打同一個 host）
+REQUEST_MAX_WORKERS = 6  # 同時爬取的分類數（請求起始間隔仍受隨機延遲節流）
+
+# 回應快取：同一天內重跑直接讀磁碟，不再打博客來（設 BOOK_CRAW_NOCACHE=1 強制重抓）
+RESPONSE_CACHE_DIR = ".cache/pages"
 
 # 模擬瀏覽器的完整 HTTP headers
 REQUEST_HEADERS: dict[str, str] = {
     "User-Agent": USER_AGENT,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
     "Accept-Language": "zh-TW,zh;q=0.9,en-US;q=0.8,en;q=0.7",
+    # br / zstd 要靠 httpx 的 brotli、zstd extras 才解得開（見 pyproject.toml）
     "Accept-Encoding": "gzip, deflate, br, zstd",
     "Referer": "https://www.books.com.tw/",
     "DNT": "1",
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import base64
+import io
 import logging
 import os
 import smtplib
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from datetime import date
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.header import Header
 
 from book_craw.config import CATEGORY_GROUPS
 from book_craw.scraper import Book
@@ -17,28 +20,34 @@ log = logging.getLogger(__name__)
 PAGES_BASE_URL = "https://u8961310.github.io/book-craw"
 MAX_BOOKS_PER_CATEGORY = 5
 
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+SMTP_ENV_VARS = ("GMAIL_USER", "GMAIL_APP_PASSWORD", "EMAIL_TO")
 
-def _full_list_url() -> str:
-    """Return the URL for today's full book list on GitHub Pages."""
-    return f"{PAGES_BASE_URL}/books/{date.today().isoformat()}.html"
 
+def _full_list_url(today: date) -> str:
+    """Return the URL for the given day's full book list on GitHub Pages."""
+    return f"{PAGES_BASE_URL}/books/{today.isoformat()}.html"
 
-def build_html(books_by_category: dict[str, list[Book]]) -> str:
+
+def build_html(books_by_category: dict[str, list[Book]], *, today: date | None = None) -> str:
     """Build an HTML email body from scraped books grouped by category."""
     total = sum(len(v) for v in books_by_category.values())
-    full_url = _full_list_url()
-
-    parts: list[str] = [
-        "<!DOCTYPE html>",
-        "<html><head><meta charset='utf-8'></head>",
-        "<body style='font-family:sans-serif;max-width:800px;margin:auto;padding:16px;'>",
-        "<h1 style='color:#333;margin-bottom:4px;'>📚 博客來新書通知</h1>",
-        f"<p style='color:#666;margin-bottom:12px;'>本週共 {total} 本新書</p>",
+    full_url = _full_list_url(today or date.today())
+
+    buf = io.StringIO()
+    w = buf.write
+    w("<!DOCTYPE html>\n")
+    w("<html><head><meta charset='utf-8'></head>\n")
+    w("<body style='font-family:sans-serif;max-width:800px;margin:auto;padding:16px;'>\n")
+    w("<h1 style='color:#333;margin-bottom:4px;'>📚 博客來新書通知</h1>\n")
+    w(f"<p style='color:#666;margin-bottom:12px;'>本週共 {total} 本新書</p>\n")
+    w(
         f"<p style='margin-bottom:20px;'>"
         f"<a href='{full_url}' "
         f"style='display:inline-block;background:#e63946;color:#fff;padding:8px 20px;"
-        f"border-radius:4px;text-decoration:none;font-weight:bold;'>查看完整書單</a></p>",
-    ]
+        f"border-radius:4px;text-decoration:none;font-weight:bold;'>查看完整書單</a></p>\n"
+    )
 
     # Collect categories not in any group (fallback)
     grouped_cats: set[str] = set()
@@ -53,100 +62,164 @@ def build_html(books_by_category: dict[str, list[Book]]) -> str:
             continue
 
         group_total = sum(len(b) for _, b in group_cats)
-        parts.append(
+        w(
             f"<div style='margin:28px 0 12px;padding:8px 12px;"
             f"background:#1d3557;border-radius:4px;'>"
             f"<span style='color:#fff;font-size:16px;font-weight:bold;'>"
             f"{group_name}</span>"
             f"<span style='color:#a8dadc;font-size:13px;margin-left:8px;'>"
-            f"共 {group_total} 本</span></div>"
+            f"共 {group_total} 本</span></div>\n"
         )
 
         for category, books in group_cats:
-            parts.append(
+            w(
                 f"<h2 style='border-bottom:2px solid #e63946;padding-bottom:4px;"
                 f"font-size:16px;margin-top:12px;'>"
-                f"{category}（{len(books)} 本）</h2>"
+                f"{category}（{len(books)} 本）</h2>\n"
             )
-            shown = books[:MAX_BOOKS_PER_CATEGORY]
-            for book in shown:
-                meta_parts = []
-                if book.author:
-                    meta_parts.append(book.author)
-                if book.price:
-                    meta_parts.append(book.price)
-                meta = " / ".join(meta_parts)
-
-                parts.append(
-                    f"<div style='margin:8px 0;padding:6px 0;border-bottom:1px solid #f0f0f0;'>"
-                    f"<a href='{book.url}' style='font-size:14px;color:#1d3557;"
-                    f"text-decoration:none;font-weight:bold;'>{book.title}</a><br>"
-                    f"<span style='font-size:12px;color:#888;'>{meta}</span>"
-                    f"</div>"
-                )
-            remaining = len(books) - len(shown)
-            if remaining > 0:
-                parts.append(
-                    f"<p style='margin:8px 0 16px;'>"
-                    f"<a href='{full_url}' style='color:#e63946;font-size:13px;'>"
-                    f"還有 {remaining} 本 →</a></p>"
-                )
+            _write_books(w, books, full_url)
 
     # Any ungrouped categories
     for category, books in books_by_category.items():
         if not books or category in grouped_cats:
             continue
-        parts.append(
+        w(
             f"<h2 style='border-bottom:2px solid #e63946;padding-bottom:4px;font-size:16px;'>"
-            f"{category}（{len(books)} 本）</h2>"
+            f"{category}（{len(books)} 本）</h2>\n"
         )
-        shown = books[:MAX_BOOKS_PER_CATEGORY]
-        for book in shown:
-            meta_parts = []
-            if book.author:
-                meta_parts.append(book.author)
-            if book.price:
-                meta_parts.append(book.price)
-            meta = " / ".join(meta_parts)
-            parts.append(
-                f"<div style='margin:8px 0;padding:6px 0;border-bottom:1px solid #f0f0f0;'>"
-                f"<a href='{book.url}' style='font-size:14px;color:#1d3557;"
-                f"text-decoration:none;font-weight:bold;'>{book.title}</a><br>"
-                f"<span style='font-size:12px;color:#888;'>{meta}</span>"
-                f"</div>"
-            )
-        remaining = len(books) - len(shown)
-        if remaining > 0:
-            parts.append(
-                f"<p style='margin:8px 0 16px;'>"
-                f"<a href='{full_url}' style='color:#e63946;font-size:13px;'>"
-                f"還有 {remaining} 本 →</a></p>"
-            )
+        _write_books(w, books, full_url)
 
-    parts.append(
+    w(
         f"<hr style='border:none;border-top:1px solid #eee;margin:24px 0 12px;'>"
         f"<p style='font-size:12px;color:#aaa;text-align:center;'>"
         f"<a href='{PAGES_BASE_URL}/index.html' style='color:#aaa;'>歷史書單</a>"
-        f"</p>"
+        f"</p>\n"
+    )
+    w("</body></html>")
+    return buf.getvalue()
+
+
+def _write_books(w: Callable[[str], object], books: list[Book], full_url: str) -> None:
+    """Write the first MAX_BOOKS_PER_CATEGORY books plus a "more" link."""
+    shown = books[:MAX_BOOKS_PER_CATEGORY]
+    for book in shown:
+        meta_parts = []
+        if book.author:
+            meta_parts.append(book.author)
+        if book.price:
+            meta_parts.append(book.price)
+        meta = " / ".join(meta_parts)
+        w(
+            f"<div style='margin:8px 0;padding:6px 0;border-bottom:1px solid #f0f0f0;'>"
+            f"<a href='{book.url}' style='font-size:14px;color:#1d3557;"
+            f"text-decoration:none;font-weight:bold;'>{book.title}</a><br>"
+            f"<span style='font-size:12px;color:#888;'>{meta}</span>"
+            f"</div>\n"
+        )
+    remaining = len(books) - len(shown)
+    if remaining > 0:
+        w(
+            f"<p style='margin:8px 0 16px;'>"
+            f"<a href='{full_url}' style='color:#e63946;font-size:13px;'>"
+            f"還有 {remaining} 本 →</a></p>\n"
+        )
+
+
+def build_message(html: str, subject: str, *, sender: str, to: Sequence[str]) -> bytes:
+    """Compose a single-part text/html message as raw RFC 5322 bytes.
+
+    The mail is always one base64-encoded HTML part, so the headers are
+    written directly rather than going through the email.mime generator.
+    Only the (possibly non-ASCII) subject needs RFC 2047 encoding.
+    """
+    # Long subjects are folded; fold with CRLF too, since smtplib sends bytes as-is.
+    encoded_subject = Header(subject, "utf-8").encode(linesep="\r\n")
+    headers = (
+        f"Subject: {encoded_subject}\r\n"
+        f"From: {sender}\r\n"
+        f"To: {', '.join(to)}\r\n"
+        "MIME-Version: 1.0\r\n"
+        'Content-Type: text/html; charset="utf-8"\r\n'
+        "Content-Transfer-Encoding: base64\r\n"
+        "\r\n"
     )
-    parts.append("</body></html>")
-    return "\n".join(parts)
+    body = base64.encodebytes(html.encode("utf-8")).replace(b"\n", b"\r\n")
+    return headers.encode("ascii") + body
+
+
+@dataclass(frozen=True)
+class SmtpConfig:
+    """Gmail credentials and recipients, read once from the environment."""
+
+    user: str
+    password: str
+    to: tuple[str, ...]
+
+    @classmethod
+    def from_env(cls) -> SmtpConfig:
+        """Build from GMAIL_USER / GMAIL_APP_PASSWORD / EMAIL_TO; fail fast if any is missing."""
+        missing = [name for name in SMTP_ENV_VARS if not os.environ.get(name)]
+        if missing:
+            raise RuntimeError(f"Missing environment variable(s): {', '.join(missing)}")
+        to = tuple(a.strip() for a in os.environ["EMAIL_TO"].split(",") if a.strip())
+        if not to:
+            raise RuntimeError("EMAIL_TO contains no recipient addresses")
+        return cls(
+            user=os.environ["GMAIL_USER"],
+            password=os.environ["GMAIL_APP_PASSWORD"],
+            to=to,
+        )
 
 
-def send_email(html: str, subject: str = "博客來新書通知") -> None:
+class Emailer:
+    """Gmail SMTP session: connect and log in once, then send any number of messages.
+
+    Usage::
+
+        with Emailer(cfg) as emailer:
+            emailer.send(html, subject)
+    """
+
+    def __init__(self, cfg: SmtpConfig) -> None:
+        self.cfg = cfg
+        self._server: smtplib.SMTP_SSL | None = None
+        self._sent = 0
+
+    def __enter__(self) -> Emailer:
+        self._server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT)
+        try:
+            self._server.login(self.cfg.user, self.cfg.password)
+        except BaseException:
+            self._server.close()
+            raise
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except smtplib.SMTPException:
+            server.close()
+
+    def send(self, html: str, subject: str = "博客來新書通知", *, to: Sequence[str] | None = None) -> None:
+        """Send one HTML mail over the open connection (recipients default to cfg.to)."""
+        if self._server is None:
+            raise RuntimeError("Emailer.send() must be called inside a `with Emailer(...)` block")
+        recipients = tuple(to) if to is not None else self.cfg.to
+        raw = build_message(html, subject, sender=self.cfg.user, to=recipients)
+
+        # 同一連線寄下一封前先重置 SMTP 交易狀態
+        if self._sent:
+            self._server.rset()
+        log.info("Sending email to %s ...", ", ".join(recipients))
+        self._server.sendmail(self.cfg.user, list(recipients), raw)
+        self._sent += 1
+        log.info("Email sent successfully.")
+
+
+def send_email(html: str, *, cfg: SmtpConfig, subject: str = "博客來新書通知") -> None:
     """Send HTML email via Gmail SMTP."""
-    gmail_user = os.environ["GMAIL_USER"]
-    gmail_pass = os.environ["GMAIL_APP_PASSWORD"]
-    email_to = os.environ["EMAIL_TO"]
-
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = gmail_user
-    msg["To"] = email_to
-    msg.attach(MIMEText(html, "html", "utf-8"))
-
-    log.info("Sending email to %s ...", email_to)
-    with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-        server.login(gmail_user, gmail_pass)
-        server.sendmail(gmail_user, email_to.split(","), msg.as_string())
-    log.info("Email sent successfully.")
+    with Emailer(cfg) as emailer:
+        emailer.send(html, subject)
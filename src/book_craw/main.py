@@ -10,8 +10,8 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from book_craw.config import CATEGORIES, DEDUP_CATEGORIES
-from book_craw.emailer import build_html, send_email
+from book_craw.config import CATEGORIES, DEDUP_CATEGORIES, REQUEST_MAX_WORKERS
+from book_craw.emailer import Emailer, SmtpConfig, build_html
 from book_craw.pages import generate_index_page, generate_stats_page, generate_weekly_page, load_previous_urls
 from book_craw.scraper import scrape_all
 
@@ -39,6 +39,13 @@ def main(argv: list[str] | None = None) -> None:
         action="store_true",
         help="不爬額外來源（電子書等）",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=REQUEST_MAX_WORKERS,
+        metavar="N",
+        help=f"同時爬取的來源數（預設 {REQUEST_MAX_WORKERS}，設 1 即逐一爬取；請求間隔仍照常節流）",
+    )
     parser.add_argument(
         "--pages",
         metavar="DIR",
@@ -60,16 +67,33 @@ def main(argv: list[str] | None = None) -> None:
                 log.error("Unknown category code: %s", code)
                 sys.exit(1)
 
+    if args.workers < 1:
+        log.error("--workers must be at least 1: %d", args.workers)
+        sys.exit(1)
+
+    # 寄信設定在爬取前就讀好，缺環境變數時立即結束，不必等爬完才失敗
+    smtp_cfg: SmtpConfig | None = None
+    if not args.dry_run:
+        try:
+            smtp_cfg = SmtpConfig.from_env()
+        except RuntimeError as e:
+            log.error("%s", e)
+            sys.exit(1)
+
+    # 整次執行共用同一個日期，跨午夜執行時頁面、信件連結與主旨也不會對不上
+    today = date.today()
+
     log.info("Starting book-craw ...")
     books_by_category = scrape_all(
         categories=args.category,
         include_preorders=not args.no_preorders,
         include_extra=not args.no_extra,
+        max_workers=args.workers,
     )
 
     # 去重：只對沒有日期過濾的來源，移除上期已出現的書籍
     if args.pages:
-        prev_urls = load_previous_urls(Path(args.pages), date.today().isoformat())
+        prev_urls = load_previous_urls(Path(args.pages), today.isoformat())
         if prev_urls:
             before = sum(len(v) for v in books_by_category.values())
             for cat in books_by_category:
@@ -89,17 +113,18 @@ def main(argv: list[str] | None = None) -> None:
 
     if args.pages:
         output_dir = Path(args.pages)
-        generate_weekly_page(books_by_category, date.today(), output_dir)
+        generate_weekly_page(books_by_category, today, output_dir)
         generate_index_page(output_dir)
         generate_stats_page(output_dir)
         log.info("Pages generated in %s (%d books).", output_dir, total)
 
-    html = build_html(books_by_category)
+    html = build_html(books_by_category, today=today)
 
-    if args.dry_run:
+    if args.dry_run or smtp_cfg is None:
         print(html)
         return
 
-    subject = f"博客來新書通知 - {date.today().isoformat()}"
-    send_email(html, subject=subject)
+    subject = f"博客來新書通知 - {today.isoformat()}"
+    with Emailer(smtp_cfg) as emailer:
+        emailer.send(html, subject=subject)
     log.info("Done. %d books sent.", total)
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import html
 import json
 import logging
+import os
 import re
+from collections.abc import Callable
 from datetime import date
 from pathlib import Path
 
@@ -14,37 +18,75 @@ from book_craw.scraper import Book
 
 log = logging.getLogger(__name__)
 
+STATS_CACHE_FILENAME = ".stats_cache.json"
+STATS_CACHE_VERSION = 1  # 快取格式變更時遞增，舊快取會被整份捨棄
+# 書單頁的輸出格式版本：改了書卡等產生 HTML 的程式碼時遞增，讓同一天重跑時重寫頁面
+# （_WEEKLY_HEAD / _WEEKLY_TAIL / _CSS 的內容會另外算進雜湊，不必手動遞增）
+WEEKLY_PAGE_FORMAT_VERSION = 1
 
-def _book_to_dict(book: Book) -> dict:
-    return {
-        "title": book.title,
-        "url": book.url,
-        "author": book.author,
-        "publisher": book.publisher,
-        "price": book.price,
-        "image_url": book.image_url,
-        "pub_date": book.pub_date,
-    }
+# 舊版書單把資料內嵌在 HTML 的 <script id="book-data"> 裡
+_BOOK_DATA_RE = re.compile(
+    rb'<script id="book-data" type="application/json">(.*?)</script>',
+    re.DOTALL,
+)
 
 
-def _load_previous_data(output_dir: Path, current_date_str: str) -> dict[str, list[dict]] | None:
-    """讀取前一期 HTML 的 book-data JSON，回傳原始資料。"""
+@functools.lru_cache(maxsize=256)
+def _esc(text: str) -> str:
+    """html.escape 的快取版本，給分類 / 群組名稱這類少量且重複出現的字串用。"""
+    return html.escape(text, quote=True)
+
+
+def _scan_books_dir(books_dir: Path) -> dict[str, os.DirEntry[str]]:
+    """掃描 books/ 一次，回傳 {日期: 該期 HTML 的 DirEntry}（未排序）。
+
+    用 os.scandir 直接拿檔名，不必替每個檔案建 Path 再做 glob 比對。
+    """
+    with os.scandir(books_dir) as it:
+        return {e.name[:-5]: e for e in it if e.name.endswith(".html") and e.is_file()}
+
+
+def _previous_page(output_dir: Path, current_date_str: str) -> Path | None:
+    """回傳日期早於 current_date_str 的最近一期 HTML 路徑。"""
     books_dir = output_dir / "books"
     if not books_dir.exists():
         return None
-    htmls = sorted(books_dir.glob("*.html"))
-    prev_files = [f for f in htmls if f.stem < current_date_str]
-    if not prev_files:
-        return None
-    prev_html = prev_files[-1].read_text(encoding="utf-8")
-    m = re.search(
-        r'<script id="book-data" type="application/json">(.*?)</script>',
-        prev_html,
-        re.DOTALL,
+    # 檔名是 ISO 日期，字串比較即日期先後；單次掃描取最大值，不必排序整個目錄
+    prev_date = max(
+        (d for d in _scan_books_dir(books_dir) if d < current_date_str),
+        default=None,
     )
+    if prev_date is None:
+        return None
+    return books_dir / f"{prev_date}.html"
+
+
+def _read_book_data(page: Path) -> dict[str, list[dict]] | None:
+    """讀取某一期的書籍資料。
+
+    新的書單把資料另存在同名的 `<date>.json`；
+    舊的書單沒有這個檔案，只能從 HTML 內嵌（經 html.escape）的 book-data 取出，
+    取出後順便補寫 JSON，之後同一期就不必再 regex + unescape。
+    """
+    data_path = page.with_suffix(".json")
+    if data_path.exists():
+        return json.loads(data_path.read_text(encoding="utf-8"))
+    # 直接在 bytes 上比對，只解碼 book-data 本身而不是整頁
+    m = _BOOK_DATA_RE.search(page.read_bytes())
     if not m:
         return None
-    return json.loads(m.group(1))
+    data = json.loads(html.unescape(m.group(1).decode("utf-8")))
+    data_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    log.info("Backfilled book data sidecar: %s", data_path)
+    return data
+
+
+def _load_previous_data(output_dir: Path, current_date_str: str) -> dict[str, list[dict]] | None:
+    """讀取前一期的書籍資料，回傳原始資料。"""
+    prev_page = _previous_page(output_dir, current_date_str)
+    if prev_page is None:
+        return None
+    return _read_book_data(prev_page)
 
 
 def load_previous_urls(output_dir: Path, current_date_str: str) -> set[str]:
@@ -63,165 +105,156 @@ def _load_previous_titles(output_dir: Path, current_date_str: str) -> set[str]:
     return {b["title"] for books in data.values() for b in books}
 
 
+def _write_category_cards(
+    w: Callable[[str], object],
+    category: str,
+    books: list[Book],
+    group_name: str,
+    prev_titles: set[str],
+) -> None:
+    """寫出單一細分類的標題與書卡 grid。"""
+    escaped_cat = _esc(category)
+    escaped_grp = _esc(group_name)
+    w(
+        f'<h3 class="sub-cat-title" data-cat="{escaped_cat}" data-group="{escaped_grp}">'
+        f"{escaped_cat}（{len(books)} 本）</h3>"
+    )
+    w(f'<div class="grid" data-cat="{escaped_cat}" data-group="{escaped_grp}">')
+    for book in books:
+        img_html = ""
+        if book.image_url:
+            img_html = (
+                f'<img src="{book.image_url}" alt="" class="cover">'
+            )
+        meta_parts = []
+        if book.author:
+            meta_parts.append(book.author)
+        if book.publisher:
+            meta_parts.append(book.publisher)
+        if book.price:
+            meta_parts.append(book.price)
+        meta = " / ".join(meta_parts)
+        new_badge = ""
+        if prev_titles and book.title not in prev_titles:
+            new_badge = '<span class="badge-new">NEW</span>'
+        date_html = ""
+        if book.pub_date:
+            date_html = f'<span class="pub-date">{book.pub_date}</span>'
+        w(
+            f'<div class="card">'
+            f"{img_html}"
+            f'<div class="card-body">'
+            f'<a href="{book.url}" target="_blank" class="book-title">{html.escape(book.title)}</a>'
+            f"{new_badge}"
+            f'<span class="meta">{html.escape(meta)}</span>'
+            f"{date_html}"
+            f"</div></div>"
+        )
+    w("</div>")
+
+
 def generate_weekly_page(
     books_by_category: dict[str, list[Book]],
     page_date: date,
     output_dir: Path,
 ) -> Path:
     """產生當週書單 HTML，回傳輸出檔案路徑。"""
-    total = sum(len(v) for v in books_by_category.values())
+    # 只保留有書的分類（維持原順序），之後各處直接用它，不必反覆檢查空分類
+    active = {c: books for c, books in books_by_category.items() if books}
+    total = sum(len(v) for v in active.values())
     date_str = page_date.isoformat()
 
-    # 準備 JSON 資料
-    json_data: dict[str, list[dict]] = {}
-    for category, books in books_by_category.items():
-        if books:
-            json_data[category] = [_book_to_dict(b) for b in books]
+    # 準備 JSON 資料（category 已是外層 key，不重複存）
+    json_data = {
+        category: [b.as_dict(with_category=False) for b in books]
+        for category, books in active.items()
+    }
 
     # 載入前一期書名做 NEW 比對
     prev_titles = _load_previous_titles(output_dir, date_str)
 
+    books_dir = output_dir / "books"
+    books_dir.mkdir(parents=True, exist_ok=True)
+    out_path = books_dir / f"{date_str}.html"
+    data_path = out_path.with_suffix(".json")
+    hash_path = out_path.with_suffix(".hash")
+
+    # 同一天重跑且內容（含 NEW 比對基準與頁面模板）沒變時不重寫，避免多餘的寫檔與 gh-pages commit
+    hash_input = json.dumps(
+        [WEEKLY_PAGE_FORMAT_VERSION, _WEEKLY_TEMPLATE_DIGEST, json_data, sorted(prev_titles)],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    digest = hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+    if (
+        out_path.exists()
+        and data_path.exists()
+        and hash_path.exists()
+        and hash_path.read_text(encoding="utf-8").strip() == digest
+    ):
+        log.info("Weekly page unchanged, skipped: %s", out_path)
+        return out_path
+
     # 細分類篩選按鈕（依當期實際有書的分類動態渲染）
     grouped_cats: set[str] = set()
     cat_order: list[str] = []  # 依 CATEGORY_GROUPS 順序排
     for _, members in CATEGORY_GROUPS:
         grouped_cats.update(members)
         for c in members:
-            if c in books_by_category and books_by_category[c] and c not in cat_order:
+            if c in active and c not in cat_order:
                 cat_order.append(c)
     # 補上未分群但有書的分類
-    for c in books_by_category:
-        if books_by_category[c] and c not in grouped_cats and c not in cat_order:
+    for c in active:
+        if c not in grouped_cats and c not in cat_order:
             cat_order.append(c)
 
     filter_buttons = ['<button class="filter-btn active" data-cat="all">全部</button>']
     for c in cat_order:
-        escaped = html.escape(c, quote=True)
-        count = len(books_by_category[c])
+        escaped = _esc(c)
+        count = len(active[c])
         filter_buttons.append(
             f'<button class="filter-btn" data-cat="{escaped}">'
             f'{escaped}<span class="filter-count">{count}</span></button>'
         )
     filter_bar = f'<div class="filter-bar">{"".join(filter_buttons)}</div>'
 
-    cards: list[str] = []
-
-    def _render_books(category: str, books: list[Book], group_name: str) -> None:
-        escaped_cat = html.escape(category, quote=True)
-        escaped_grp = html.escape(group_name, quote=True)
-        cards.append(
-            f'<h3 class="sub-cat-title" data-cat="{escaped_cat}" data-group="{escaped_grp}">'
-            f"{escaped_cat}（{len(books)} 本）</h3>"
-        )
-        cards.append(f'<div class="grid" data-cat="{escaped_cat}" data-group="{escaped_grp}">')
-        for book in books:
-            img_html = ""
-            if book.image_url:
-                img_html = (
-                    f'<img src="{book.image_url}" alt="" class="cover">'
-                )
-            meta_parts = []
-            if book.author:
-                meta_parts.append(book.author)
-            if book.publisher:
-                meta_parts.append(book.publisher)
-            if book.price:
-                meta_parts.append(book.price)
-            meta = " / ".join(meta_parts)
-            new_badge = ""
-            if prev_titles and book.title not in prev_titles:
-                new_badge = '<span class="badge-new">NEW</span>'
-            date_html = ""
-            if book.pub_date:
-                date_html = f'<span class="pub-date">{book.pub_date}</span>'
-            cards.append(
-                f'<div class="card">'
-                f"{img_html}"
-                f'<div class="card-body">'
-                f'<a href="{book.url}" target="_blank" class="book-title">{html.escape(book.title)}</a>'
-                f"{new_badge}"
-                f'<span class="meta">{html.escape(meta)}</span>'
-                f"{date_html}"
-                f"</div></div>"
+    # 先刪掉舊雜湊：寫到一半中斷時，下次重跑不會誤判「沒變」而留下殘缺頁面
+    hash_path.unlink(missing_ok=True)
+
+    # 邊產生邊寫檔，書卡不必先整串組在記憶體裡；寫進暫存檔，完成後才換名取代舊頁面
+    tmp_path = out_path.with_suffix(".html.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fp:
+        w = fp.write
+        w(_WEEKLY_HEAD.format(date_str=date_str, css=_CSS, total=total, filter_bar=filter_bar))
+
+        for group_name, members in CATEGORY_GROUPS:
+            group_cats = [(c, active[c]) for c in members if c in active]
+            if not group_cats:
+                continue
+            group_total = sum(len(b) for _, b in group_cats)
+            escaped_grp = _esc(group_name)
+            w(
+                f'<h2 class="group-title" data-group="{escaped_grp}">'
+                f"{escaped_grp}"
+                f'<span class="group-count">共 {group_total} 本</span></h2>'
             )
-        cards.append("</div>")
+            for category, books in group_cats:
+                _write_category_cards(w, category, books, group_name, prev_titles)
 
-    for group_name, members in CATEGORY_GROUPS:
-        group_cats = [(c, books_by_category[c]) for c in members
-                      if c in books_by_category and books_by_category[c]]
-        if not group_cats:
-            continue
-        group_total = sum(len(b) for _, b in group_cats)
-        escaped_grp = html.escape(group_name, quote=True)
-        cards.append(
-            f'<h2 class="group-title" data-group="{escaped_grp}">'
-            f"{escaped_grp}"
-            f'<span class="group-count">共 {group_total} 本</span></h2>'
-        )
-        for category, books in group_cats:
-            _render_books(category, books, group_name)
+        # 未分群的分類
+        for category, books in active.items():
+            if category in grouped_cats:
+                continue
+            _write_category_cards(w, category, books, category, prev_titles)
 
-    # 未分群的分類
-    for category, books in books_by_category.items():
-        if not books or category in grouped_cats:
-            continue
-        _render_books(category, books, category)
+        w(_WEEKLY_TAIL)
 
-    json_script = (
-        '<script id="book-data" type="application/json">'
-        + html.escape(json.dumps(json_data, ensure_ascii=False), quote=False)
-        + "</script>"
-    )
+    tmp_path.replace(out_path)
 
-    filter_js = """<script>
-(function(){
-  var btns=document.querySelectorAll('.filter-btn');
-  btns.forEach(function(btn){
-    btn.addEventListener('click',function(){
-      btns.forEach(function(b){b.classList.remove('active')});
-      btn.classList.add('active');
-      var cat=btn.getAttribute('data-cat');
-      // 細分類元素：標 data-cat 的 h3 與 grid
-      document.querySelectorAll('[data-cat]').forEach(function(el){
-        if(el.classList.contains('filter-btn')) return;
-        el.style.display=(cat==='all'||el.getAttribute('data-cat')===cat)?'':'none';
-      });
-      // 群組標題：只在「全部」時顯示，篩單一分類時隱藏
-      document.querySelectorAll('.group-title').forEach(function(el){
-        el.style.display=(cat==='all')?'':'none';
-      });
-    });
-  });
-})();
-</script>"""
-
-    page_html = f"""<!DOCTYPE html>
-<html lang="zh-Hant">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>書單 {date_str}</title>
-<style>
-{_css()}
-</style>
-</head>
-<body>
-<div class="container">
-  <a href="../index.html" class="back-link">&larr; 返回首頁</a>
-  <h1>博客來新書書單 — {date_str}</h1>
-  <p class="summary">共 {total} 本書</p>
-  {filter_bar}
-  {"".join(cards)}
-</div>
-{json_script}
-{filter_js}
-</body>
-</html>"""
-
-    books_dir = output_dir / "books"
-    books_dir.mkdir(parents=True, exist_ok=True)
-    out_path = books_dir / f"{date_str}.html"
-    out_path.write_text(page_html, encoding="utf-8")
+    # 書籍資料另存 JSON，供下一期去重 / NEW 比對與統計頁直接讀取
+    data_path.write_text(json.dumps(json_data, ensure_ascii=False), encoding="utf-8")
+    # 雜湊最後寫：有它就代表頁面與 JSON 都已完整寫好
+    hash_path.write_text(digest, encoding="utf-8")
     log.info("Generated weekly page: %s", out_path)
     return out_path
 
@@ -232,11 +265,10 @@ def generate_index_page(output_dir: Path) -> Path:
     if not books_dir.exists():
         books_dir.mkdir(parents=True, exist_ok=True)
 
-    files = sorted(books_dir.glob("*.html"), reverse=True)
+    files = sorted(_scan_books_dir(books_dir), reverse=True)
 
     rows: list[str] = []
-    for f in files:
-        date_str = f.stem
+    for date_str in files:
         rows.append(
             f'<li><a href="books/{date_str}.html">{date_str} 書單</a></li>'
         )
@@ -253,7 +285,7 @@ def generate_index_page(output_dir: Path) -> Path:
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>博客來新書書單</title>
 <style>
-{_css()}
+{_CSS}
 </style>
 </head>
 <body>
@@ -272,8 +304,28 @@ def generate_index_page(output_dir: Path) -> Path:
     return out_path
 
 
+def _load_stats_cache(cache_path: Path) -> dict[str, dict]:
+    """讀取統計快取的 entries；不存在、格式壞掉或版本不符時回傳空 dict。"""
+    try:
+        raw = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != STATS_CACHE_VERSION:
+        return {}
+    return raw.get("entries", {})
+
+
+def _parse_week_stats(page: Path) -> dict | None:
+    """統計單期書籍資料，回傳 {"total": 總數, "by_cat": {分類: 數量}}。"""
+    data = _read_book_data(page)
+    if data is None:
+        return None
+    by_cat = {cat: len(books) for cat, books in data.items()}
+    return {"total": sum(by_cat.values()), "by_cat": by_cat}
+
+
 def generate_stats_page(output_dir: Path) -> Path:
-    """掃描 books/*.html 的 book-data JSON 產生統計頁面。"""
+    """掃描 books/ 下各期的書籍資料產生統計頁面。"""
     books_dir = output_dir / "books"
     if not books_dir.exists():
         books_dir.mkdir(parents=True, exist_ok=True)
@@ -281,22 +333,34 @@ def generate_stats_page(output_dir: Path) -> Path:
     weekly_stats: list[tuple[str, int]] = []  # (date_str, count)
     category_totals: dict[str, int] = {}
 
-    for f in sorted(books_dir.glob("*.html")):
-        content = f.read_text(encoding="utf-8")
-        m = re.search(
-            r'<script id="book-data" type="application/json">(.*?)</script>',
-            content,
-            re.DOTALL,
-        )
-        if not m:
-            continue
-        data: dict[str, list[dict]] = json.loads(html.unescape(m.group(1)))
-        week_total = 0
-        for cat, books in data.items():
-            count = len(books)
-            week_total += count
+    # 每期的統計結果快取在 .stats_cache.json，以「日期:資料檔大小」為 key，
+    # 只有新增或改過的書單才需要重新解析。不用 mtime，因為 CI 每次都重新 clone gh-pages。
+    cache_path = output_dir / STATS_CACHE_FILENAME
+    cache = _load_stats_cache(cache_path)
+    fresh_cache: dict[str, dict] = {}
+
+    pages = _scan_books_dir(books_dir)
+    for date_str in sorted(pages):
+        page = Path(pages[date_str].path)
+        try:
+            size = page.with_suffix(".json").stat().st_size
+        except FileNotFoundError:  # 舊版書單沒有 JSON，資料在 HTML 裡
+            size = pages[date_str].stat().st_size
+        key = f"{date_str}:{size}"
+        entry = cache.get(key)
+        if entry is None:
+            entry = _parse_week_stats(page)
+            if entry is None:
+                continue
+        fresh_cache[key] = entry
+        for cat, count in entry["by_cat"].items():
             category_totals[cat] = category_totals.get(cat, 0) + count
-        weekly_stats.append((f.stem, week_total))
+        weekly_stats.append((date_str, entry["total"]))
+
+    cache_path.write_text(
+        json.dumps({"version": STATS_CACHE_VERSION, "entries": fresh_cache}, ensure_ascii=False),
+        encoding="utf-8",
+    )
 
     # 彙總數據
     total_weeks = len(weekly_stats)
@@ -337,7 +401,7 @@ def generate_stats_page(output_dir: Path) -> Path:
         pct = gtotal / max_group * 100
         group_bars.append(
             f'<div class="bar-row">'
-            f'<span class="bar-label">{html.escape(gname)}</span>'
+            f'<span class="bar-label">{_esc(gname)}</span>'
             f'<div class="bar-track"><div class="bar-fill" style="width:{pct:.1f}%;background:{gcolor}"></div></div>'
             f'<span class="bar-value">{gtotal}</span>'
             f"</div>"
@@ -359,13 +423,13 @@ def generate_stats_page(output_dir: Path) -> Path:
             pct = count / local_max * 100
             bars.append(
                 f'<div class="bar-row">'
-                f'<span class="bar-label">{html.escape(cat)}</span>'
+                f'<span class="bar-label">{_esc(cat)}</span>'
                 f'<div class="bar-track"><div class="bar-fill" style="width:{pct:.1f}%;background:{color}"></div></div>'
                 f'<span class="bar-value">{count}</span>'
                 f"</div>"
             )
         group_sections.append(
-            f'<h3 class="group-title">{html.escape(group_name)}</h3>'
+            f'<h3 class="group-title">{_esc(group_name)}</h3>'
             f'<div class="chart">{"".join(bars)}</div>'
         )
 
@@ -437,8 +501,8 @@ def generate_stats_page(output_dir: Path) -> Path:
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>書單統計</title>
 <style>
-{_css()}
-{_stats_css()}
+{_CSS}
+{_STATS_CSS}
 </style>
 </head>
 <body>
@@ -466,9 +530,57 @@ def generate_stats_page(output_dir: Path) -> Path:
     return out_path
 
 
-def _stats_css() -> str:
-    """統計頁面專用 CSS：摘要卡片、長條圖、SVG 折線圖、RWD 手機版。"""
-    return """\
+# 週書單頁的固定外框；CSS 含大括號，所以用 {css} 參數帶入而不是寫死在模板裡
+_WEEKLY_HEAD = """<!DOCTYPE html>
+<html lang="zh-Hant">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>書單 {date_str}</title>
+<style>
+{css}
+</style>
+</head>
+<body>
+<div class="container">
+  <a href="../index.html" class="back-link">&larr; 返回首頁</a>
+  <h1>博客來新書書單 — {date_str}</h1>
+  <p class="summary">共 {total} 本書</p>
+  {filter_bar}
+  """
+
+# 分類篩選按鈕的前端腳本
+_FILTER_JS = """<script>
+(function(){
+  var btns=document.querySelectorAll('.filter-btn');
+  btns.forEach(function(btn){
+    btn.addEventListener('click',function(){
+      btns.forEach(function(b){b.classList.remove('active')});
+      btn.classList.add('active');
+      var cat=btn.getAttribute('data-cat');
+      // 細分類元素：標 data-cat 的 h3 與 grid
+      document.querySelectorAll('[data-cat]').forEach(function(el){
+        if(el.classList.contains('filter-btn')) return;
+        el.style.display=(cat==='all'||el.getAttribute('data-cat')===cat)?'':'none';
+      });
+      // 群組標題：只在「全部」時顯示，篩單一分類時隱藏
+      document.querySelectorAll('.group-title').forEach(function(el){
+        el.style.display=(cat==='all')?'':'none';
+      });
+    });
+  });
+})();
+</script>"""
+
+_WEEKLY_TAIL = f"""
+</div>
+{_FILTER_JS}
+</body>
+</html>"""
+
+
+# 統計頁面專用 CSS：摘要卡片、長條圖、SVG 折線圖、RWD 手機版
+_STATS_CSS = """\
 .stats-cards{display:flex;gap:16px;margin-bottom:32px;flex-wrap:wrap}
 .stat-card{flex:1;min-width:120px;background:#fff;border:1px solid #eee;border-radius:8px;
   padding:20px 16px;text-align:center;display:flex;flex-direction:column;gap:4px}
@@ -489,8 +601,8 @@ def _stats_css() -> str:
 }"""
 
 
-def _css() -> str:
-    return """\
+# 所有頁面共用的 CSS（模組常數，產生多頁時不必每次重建字串）
+_CSS = """\
 *{box-sizing:border-box;margin:0;padding:0}
 body{font-family:-apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,Helvetica,Arial,sans-serif;
   background:#f5f5f5;color:#333;line-height:1.6}
@@ -536,3 +648,9 @@ h1{margin-bottom:8px;color:#1d3557}
   .grid{grid-template-columns:repeat(auto-fill,minmax(140px,1fr));gap:10px}
   .bar-label{width:80px;font-size:11px}
 }"""
+
+
+# 書單頁模板的雜湊，算進 generate_weekly_page 的跳過判斷，模板一改就會重寫頁面
+_WEEKLY_TEMPLATE_DIGEST = hashlib.sha256(
+    (_WEEKLY_HEAD + _WEEKLY_TAIL + _CSS).encode("utf-8")
+).hexdigest()
@@ -2,53 +2,123 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import logging
+import os
 import random
 import re
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, timedelta
+from functools import partial
+from pathlib import Path
+from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from book_craw.config import (
     CATEGORIES,
     EXTRA_SOURCES,
     NEW_BOOKS_URL_TEMPLATE,
     PREORDER_URL,
+    REQUEST_BURST,
     REQUEST_DELAY_MAX,
     REQUEST_DELAY_MIN,
     REQUEST_HEADERS,
+    REQUEST_MAX_CONNECTIONS,
+    REQUEST_MAX_KEEPALIVE,
     REQUEST_MAX_RETRIES,
+    REQUEST_MAX_WORKERS,
     REQUEST_TIMEOUT,
+    RESPONSE_CACHE_DIR,
 )
 
 log = logging.getLogger(__name__)
 
 # 全域共用 HTTP client（維持 cookies 與連線池，像正常使用者連續瀏覽）
 _client: httpx.Client | None = None
+_client_lock = threading.Lock()
 
 
 def _get_client() -> httpx.Client:
-    """取得或建立共用的 HTTP client。"""
+    """取得或建立共用的 HTTP client（多執行緒安全）。"""
     global _client
-    if _client is None:
-        _client = httpx.Client(
-            headers=REQUEST_HEADERS,
-            timeout=REQUEST_TIMEOUT,
-            follow_redirects=True,
-        )
-    return _client
-
-
-def _random_delay() -> None:
-    """隨機等待，模擬人類瀏覽間隔。"""
-    delay = random.uniform(REQUEST_DELAY_MIN, REQUEST_DELAY_MAX)
-    time.sleep(delay)
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                headers=REQUEST_HEADERS,
+                timeout=REQUEST_TIMEOUT,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=REQUEST_MAX_CONNECTIONS,
+                    max_keepalive_connections=REQUEST_MAX_KEEPALIVE,
+                ),
+            )
+        return _client
 
 
-@dataclass
+def close_client() -> None:
+    """關閉共用的 HTTP client，釋放連線池。"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# 單獨呼叫 fetch_page（例如 __main__ 的測試）時也在結束前釋放連線
+atexit.register(close_client)
+
+
+class RateLimiter:
+    """Token bucket 節流：每隔一段隨機間隔補一個 token，最多累積 burst 個。
+
+    閒置一陣子後可以連發 burst 個請求，之後每個請求都要等下一個 token，
+    長期平均頻率仍是每 delay_min～delay_max 秒一個，模擬人類瀏覽。
+    多個執行緒共用同一個 limiter，並行只會重疊等待回應的時間。
+    """
+
+    def __init__(self, delay_min: float, delay_max: float, burst: int = 1) -> None:
+        self._delay_min = delay_min
+        self._delay_max = delay_max
+        self._burst = burst
+        self._tokens = burst
+        self._refill_at = 0.0  # 下一個 token 補進來的時間（time.monotonic），桶滿時不使用
+        self._lock = threading.Lock()
+
+    def _interval(self) -> float:
+        return random.uniform(self._delay_min, self._delay_max)
+
+    def acquire(self) -> None:
+        """取得一個 token，沒有就睡到輪到自己為止。"""
+        with self._lock:
+            now = time.monotonic()
+            while self._tokens < self._burst and self._refill_at <= now:
+                self._tokens += 1
+                self._refill_at += self._interval()
+            if self._tokens:
+                if self._tokens == self._burst:
+                    # 桶原本是滿的：補 token 的時鐘從這次取用開始算
+                    self._refill_at = now + self._interval()
+                self._tokens -= 1
+                return
+            # 沒有 token：預約下一個補進來的 token
+            start = self._refill_at
+            self._refill_at += self._interval()
+        time.sleep(start - now)
+
+
+_limiter = RateLimiter(REQUEST_DELAY_MIN, REQUEST_DELAY_MAX, burst=REQUEST_BURST)
+
+
+@dataclass(slots=True)
 class Book:
     title: str
     url: str
@@ -58,17 +128,176 @@ class Book:
     image_url: str = ""
     category: str = ""
     pub_date: str = ""  # e.g. "2026-02-13"
+    # pub_date 的整數形式（20260213，沒有日期時為 0），建立時算好一次供過濾比較
+    pub_date_int: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 只認 YYYY-MM-DD；其他格式維持 0，過濾時當作沒有日期
+        digits = self.pub_date.replace("-", "")
+        if len(digits) == 8 and digits.isascii() and digits.isdigit():
+            self.pub_date_int = int(digits)
+
+    def as_dict(self, *, with_category: bool = True) -> dict[str, str]:
+        """轉成可直接 JSON 序列化的 dict，比 dataclasses.asdict 少了遞迴複製。
+
+        with_category=False 時不含 category（例如已用分類當外層 key 時）。
+        """
+        d = {
+            "title": self.title,
+            "url": self.url,
+            "author": self.author,
+            "publisher": self.publisher,
+            "price": self.price,
+            "image_url": self.image_url,
+        }
+        if with_category:
+            d["category"] = self.category
+        d["pub_date"] = self.pub_date
+        return d
+
+
+def _has_class(name: str) -> str:
+    """XPath 條件：class 屬性含有指定的 class token（等同 CSS 的 .name）。"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _text_getter(path: str) -> Callable[[etree._Element], str]:
+    """把指向單一節點的 XPath 包成取文字的函式，結果同 _text()；找不到節點時回傳空字串。
+
+    直接用 //text() 取回各段文字（不建節點物件），每段去頭尾空白後再串接。
+    """
+    xp = etree.XPath(f"{path}//text()", smart_strings=False)
+    return lambda el: "".join(t.strip() for t in xp(el))
+
+
+# 博客來一律是 UTF-8：直接解析 bytes，省去先解碼成 str 再交給 lxml 的一趟。
+# 註解節點對擷取文字沒有貢獻（itertext/string() 本來就略過），解析時直接丟掉少建一些節點
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8", remove_comments=True)
+
+# 新書頁面要解析的區塊標題
+_RECENT_SECTION_TITLE = "近期新書"
+
+# 「近期新書」分段餵給 pull parser 時每次送進的大小
+_PARSE_CHUNK_SIZE = 16 * 1024
+
+# 解析用的 XPath，模組載入時編譯一次
+_MOD_A_ANCESTOR_XP = etree.XPath("ancestor::div[contains(@class, 'mod_a')][1]")
+_ITEM_DIV_XP = etree.XPath(f".//div[{_has_class('item')}]")
+# 封面：優先取 img.cover，沒有才退回第一張 img，一次查詢完成（最多回傳一個節點）
+_COVER_IMG = f"img[{_has_class('cover')}]"
+_COVER_IMG_XP = etree.XPath(
+    f"(.//{_COVER_IMG})[1] | (self::*[not(.//{_COVER_IMG})]//img)[1]"
+)
+# 額外來源（電子書等）的版面
+_ALL_H3_XP = etree.XPath("//h3")
+_MOD_ANCESTOR_XP = etree.XPath("ancestor::div[contains(concat(' ', normalize-space(@class)), ' mod')][1]")
+_ITEM_XP = etree.XPath(f".//*[self::li or self::div][{_has_class('item')}]")
+
+# 書籍欄位：直接取回文字，不必先建出節點物件；找不到時回傳空字串。
+# 書名 / 作者 / 出版社會拿來跟前幾期比對，維持 _text() 的逐段 strip 語意
+_PRODUCT_LINK = "((.//h4)[1]//a[contains(@href, '/products/')])[1]"
+_HREF_XP = etree.XPath(f"string({_PRODUCT_LINK}/@href)", smart_strings=False)
+_get_title = _text_getter(_PRODUCT_LINK)
+_get_author = _text_getter("(.//a[contains(@href, 'adv_author')])[1]")
+_get_any_author = _text_getter(
+    "(.//a[contains(@href, 'adv_author') or contains(@href, '/f/author')])[1]"
+)
+_INFO_LI = f"(.//li[{_has_class('info')}])[1]"
+_get_publisher = _text_getter(f"({_INFO_LI}//a[contains(@href, 'pubid')])[1]")
+# info / 售價文字只用來跑 regex，用 string() 取整段即可
+_INFO_TEXT_XP = etree.XPath(f"string({_INFO_LI})", smart_strings=False)
+# 售價文字：有 price_box 取第一個 price_box，否則取整個 item（聯集裡只會有一個節點）
+_PRICE_BOX = f"div[{_has_class('price_box')}]"
+_PRICE_A = f"li[{_has_class('price_a')}]"
+_PRICE_TEXT_XP = etree.XPath(
+    f"string((.//{_PRICE_BOX})[1] | self::*[not(.//{_PRICE_BOX})])", smart_strings=False
+)
+# 額外來源：依序退回 price_box → price_a → 整個 item
+_ANY_PRICE_TEXT_XP = etree.XPath(
+    f"string((self::*[.//{_PRICE_BOX}]//{_PRICE_BOX})[1]"
+    f" | (self::*[not(.//{_PRICE_BOX})]//{_PRICE_A})[1]"
+    f" | self::*[not(.//{_PRICE_BOX}) and not(.//{_PRICE_A})])",
+    smart_strings=False,
+)
+
+# 每個 item 依序要取的文字欄位：書名、作者、出版社、info 文字、售價文字
+_RECENT_FIELDS = (_get_title, _get_author, _get_publisher, _INFO_TEXT_XP, _PRICE_TEXT_XP)
+_EXTRA_FIELDS = (_get_title, _get_any_author, _get_publisher, _INFO_TEXT_XP, _ANY_PRICE_TEXT_XP)
+
+# 出版日期與售價的文字樣式
+_PUB_DATE_RE = re.compile(r"出版日期：(\d{4}-\d{2}-\d{2})")
+_DISCOUNT_PRICE_RE = re.compile(r"(\d+)\s*折\s*(\d+)\s*元")
+_PRICE_RE = re.compile(r"(\d+)\s*元")
+
+
+def _text(el: etree._Element) -> str:
+    """等同 BeautifulSoup 的 get_text(strip=True)：每段文字去頭尾空白後直接串接。"""
+    return "".join(t.strip() for t in el.itertext())
+
+
+def _cache_enabled() -> bool:
+    """BOOK_CRAW_NOCACHE 設成 1/true/yes/on 時停用快取（設 0 或空字串不算）。"""
+    return os.environ.get("BOOK_CRAW_NOCACHE", "").strip().lower() not in ("1", "true", "yes", "on")
+
+
+def _cache_path(url: str, today: str) -> Path:
+    """快取檔路徑：以 URL 雜湊加上當天日期為 key，隔天自然失效。"""
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return Path(RESPONSE_CACHE_DIR) / f"{key}-{today}.html"
+
+
+def _write_cache(path: Path, html: bytes, today: str) -> None:
+    """寫入快取檔，並順手刪掉前幾天留下的快取。"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 先寫暫存檔再換名，中途中斷也不會留下半個快取檔
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(html)
+    tmp.replace(path)
+    suffix = f"-{today}."
+    for entry in path.parent.iterdir():
+        if suffix not in entry.name:
+            entry.unlink(missing_ok=True)
+
 
+def fetch_page(url: str, expect: Sequence[str] = ()) -> bytes:
+    """取得頁面 HTML 原始位元組：當天已抓過就讀磁碟快取，否則連網下載並寫入快取。
 
-def fetch_page(url: str) -> str:
-    """GET 頁面並回傳 HTML，失敗時自動重試（指數退避）。"""
+    只有內容非空、且含有 expect 其中一個字串（該頁應有的區塊標題）時才寫入快取，
+    空白頁或反爬蟲頁不會被留下來，失敗後重跑時會重新下載。
+    """
+    if not _cache_enabled():
+        return _download(url)
+
+    today = date.today().isoformat()
+    path = _cache_path(url, today)
+    try:
+        html = path.read_bytes()
+    except FileNotFoundError:
+        pass
+    else:
+        log.info("Cache hit: %s", url)
+        return html
+
+    html = _download(url)
+    if html and (not expect or any(marker.encode() in html for marker in expect)):
+        _write_cache(path, html, today)
+    else:
+        log.warning("Not caching %s: expected section missing", url)
+    return html
+
+
+def _download(url: str) -> bytes:
+    """GET 頁面並回傳未解碼的 HTML，失敗時自動重試（指數退避）。"""
     client = _get_client()
     for attempt in range(1, REQUEST_MAX_RETRIES + 1):
+        _limiter.acquire()
         try:
             resp = client.get(url)
             resp.raise_for_status()
-            resp.encoding = "utf-8"
-            return resp.text
+            log.debug("%s: %s, content-encoding=%s, %d bytes decoded",
+                      url, resp.http_version, resp.headers.get("content-encoding", "identity"),
+                      len(resp.content))
+            return resp.content
         except (httpx.HTTPStatusError, httpx.TransportError) as e:
             if attempt == REQUEST_MAX_RETRIES:
                 raise
@@ -77,7 +306,15 @@ def fetch_page(url: str) -> str:
             log.warning("請求失敗 (%s)，%d 秒後重試 (%d/%d): %s",
                         e, wait, attempt, REQUEST_MAX_RETRIES, url)
             time.sleep(wait)
-    return ""  # unreachable
+    return b""  # unreachable
+
+
+_SITE_BASE = "https://www.books.com.tw/"
+
+
+def _abs_url(url: str) -> str:
+    """以博客來首頁為基準補成完整網址（絕對、// 開頭、/ 開頭與相對路徑都正確處理）。"""
+    return urljoin(_SITE_BASE, url)
 
 
 def _extract_cover_url(img) -> str:
@@ -86,107 +323,108 @@ def _extract_cover_url(img) -> str:
         url = (img.get(attr) or "").strip()
         if not url or url.startswith("data:"):
             continue
-        if url.startswith("//"):
-            url = "https:" + url
-        return url
+        return _abs_url(url)
     return ""
 
 
-def _parse_recent_books(html: str, category: str = "") -> list[Book]:
-    """Parse the '近期新書' section which contains pub dates."""
-    soup = BeautifulSoup(html, "lxml")
-    books: list[Book] = []
+def _find_recent_section(html: bytes) -> tuple[bool, etree._Element | None]:
+    """分段解析頁面，找到「近期新書」所在的 mod_a 區塊並在它結束時停止。
+
+    只用得到這個區塊，後面的 HTML 不必再建樹。回傳（是否找到標題, 區塊）；
+    找到標題但不在 mod_a 裡時區塊為 None。
+    """
+    parser = etree.HTMLPullParser(
+        events=("end",), tag=("h3", "div"), encoding="utf-8", remove_comments=True
+    )
+    section = None
+    try:
+        for start in range(0, len(html), _PARSE_CHUNK_SIZE):
+            parser.feed(html[start:start + _PARSE_CHUNK_SIZE])
+            for _, el in parser.read_events():
+                if section is not None:
+                    if el is section:
+                        return True, section
+                elif el.tag == "h3" and _RECENT_SECTION_TITLE in "".join(el.itertext()):
+                    ancestor = _MOD_A_ANCESTOR_XP(el)
+                    if not ancestor:
+                        return True, None
+                    section = ancestor[0]
+    finally:
+        # 提早結束時也要收尾，讓尚未關閉的標籤補齊
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # 空白輸入一個元素都沒有，close() 會報錯；當作找不到區塊
+            pass
+    return section is not None, section
+
 
+def _iter_recent_books(html: bytes, category: str = "") -> Iterator[Book]:
+    """Parse the '近期新書' section which contains pub dates.
+
+    逐本 yield，交給 _filter_recent 時只有留下的書會被收進 list。
+    """
     # Find the 近期新書 section
-    h3 = None
-    for tag in soup.find_all("h3"):
-        if "近期新書" in tag.get_text():
-            h3 = tag
-            break
-    if h3 is None:
+    found, section = _find_recent_section(html)
+    if not found:
         log.warning("Could not find '近期新書' section (category=%s)", category)
-        return books
-
-    section = h3.find_parent("div", class_=re.compile(r"mod_a"))
+        return
     if section is None:
-        return books
+        return
 
-    for item_div in section.find_all("div", class_="item"):
-        # Title & URL
-        h4 = item_div.find("h4")
-        if not h4:
-            continue
-        link = h4.find("a", href=re.compile(r"/products/"))
-        if not link:
+    count = 0
+
+    for item_div in _ITEM_DIV_XP(section):
+        # URL（沒有商品連結就不是書）
+        href = _HREF_XP(item_div)
+        if not href:
             continue
-        title = link.get_text(strip=True)
-        href = link["href"]
-        if not href.startswith("http"):
-            href = "https://www.books.com.tw" + href
-
-        # Author
-        author = ""
-        author_link = item_div.find("a", href=re.compile(r"adv_author"))
-        if author_link:
-            author = author_link.get_text(strip=True)
-
-        # Publisher & pub date from <li class="info">
-        publisher = ""
+        href = _abs_url(href)
+
+        # 其餘文字欄位一次取完：書名、作者、出版社、<li class="info"> 文字、售價文字
+        title, author, publisher, info_text, price_text = [
+            get(item_div) for get in _RECENT_FIELDS
+        ]
+
+        # Pub date from <li class="info">
         pub_date = ""
-        info_li = item_div.find("li", class_="info")
-        if info_li:
-            pub_link = info_li.find("a", href=re.compile(r"pubid"))
-            if pub_link:
-                publisher = pub_link.get_text(strip=True)
-            info_text = info_li.get_text()
-            m = re.search(r"出版日期：(\d{4}-\d{2}-\d{2})", info_text)
-            if m:
-                pub_date = m.group(1)
+        m = _PUB_DATE_RE.search(info_text)
+        if m:
+            pub_date = m.group(1)
 
         # Price
         price = ""
-        price_box = item_div.find("div", class_="price_box") or item_div
-        price_text = price_box.get_text()
-        m = re.search(r"(\d+)\s*折\s*(\d+)\s*元", price_text)
+        m = _DISCOUNT_PRICE_RE.search(price_text)
         if m:
             price = f"{m.group(1)}折 {m.group(2)}元"
 
         # Cover image
         image_url = ""
-        img = item_div.find("img", class_="cover") or item_div.find("img")
+        img = _COVER_IMG_XP(item_div)
         if img:
-            image_url = _extract_cover_url(img)
-
-        books.append(
-            Book(
-                title=title,
-                url=href,
-                author=author,
-                publisher=publisher,
-                price=price,
-                image_url=image_url,
-                category=category,
-                pub_date=pub_date,
-            )
+            image_url = _extract_cover_url(img[0])
+
+        count += 1
+        yield Book(
+            title=title,
+            url=href,
+            author=author,
+            publisher=publisher,
+            price=price,
+            image_url=image_url,
+            category=category,
+            pub_date=pub_date,
         )
 
-    log.info("Parsed %d books from 近期新書 (category=%s)", len(books), category)
-    return books
+    log.info("Parsed %d books from 近期新書 (category=%s)", count, category)
 
 
-def _filter_recent(books: list[Book], days: int = 7) -> list[Book]:
+def _filter_recent(books: Iterable[Book], days: int = 7) -> list[Book]:
     """Keep only books published within the last N days."""
     cutoff = date.today() - timedelta(days=days)
-    result = []
-    for b in books:
-        if not b.pub_date:
-            continue
-        try:
-            pub = date.fromisoformat(b.pub_date)
-        except ValueError:
-            continue
-        if pub >= cutoff:
-            result.append(b)
+    # 沒有日期的書 pub_date_int 為 0，自然會被濾掉
+    cutoff_i = cutoff.year * 10000 + cutoff.month * 100 + cutoff.day
+    result = [b for b in books if b.pub_date_int >= cutoff_i]
     log.info("Filtered to %d books published after %s", len(result), cutoff)
     return result
 
@@ -197,47 +435,46 @@ _EXTRA_SOURCE_CONFIG: dict[str, dict] = {
 
 
 def _parse_extra_source(
-    html: str,
+    html: bytes,
     category: str,
     keywords: list[str],
     apply_date_filter: bool,
     recent_days: int = 7,
 ) -> list[Book]:
     """Parse books from an extra source page by section keywords."""
-    soup = BeautifulSoup(html, "lxml")
+    try:
+        root = lxml.html.document_fromstring(html, parser=_HTML_PARSER)
+    except etree.ParserError:
+        # 空白頁（或只剩註解）：lxml 建不出文件
+        log.warning("Empty page, no section for keywords %s (category=%s)", keywords, category)
+        return []
 
     # Find sections matching keywords
     sections = []
-    for h3 in soup.find_all("h3"):
-        text = h3.get_text(strip=True)
+    for h3 in _ALL_H3_XP(root):
+        text = _text(h3)
         if any(kw in text for kw in keywords):
-            parent = h3.find_parent("div", class_=re.compile(r"^mod"))
+            parent = _MOD_ANCESTOR_XP(h3)
             if parent:
-                sections.append(parent)
+                sections.append(parent[0])
 
     if not sections:
         log.warning("No section found for keywords %s (category=%s)", keywords, category)
         return []
 
     # Pick the section with the most items
-    best = max(sections, key=lambda s: len(s.find_all(["li", "div"], class_="item")))
+    best = max(sections, key=lambda s: len(_ITEM_XP(s)))
 
-    items = best.find_all(["li", "div"], class_="item")
+    items = _ITEM_XP(best)
     books: list[Book] = []
     seen_urls: set[str] = set()
 
     for item in items:
-        # Title & URL
-        h4 = item.find("h4")
-        if not h4:
+        # URL（沒有商品連結就不是書）
+        href = _HREF_XP(item)
+        if not href:
             continue
-        link = h4.find("a", href=re.compile(r"/products/"))
-        if not link:
-            continue
-        title = link.get_text(strip=True)
-        href = link["href"]
-        if not href.startswith("http"):
-            href = "https://www.books.com.tw" + href
+        href = _abs_url(href)
 
         # Deduplicate (carousel pages may repeat items)
         clean_url = href.split("?")[0]
@@ -245,46 +482,33 @@ def _parse_extra_source(
             continue
         seen_urls.add(clean_url)
 
-        # Author — support both adv_author and /f/author
-        author = ""
-        author_link = item.find("a", href=re.compile(r"(adv_author|/f/author)"))
-        if author_link:
-            author = author_link.get_text(strip=True)
+        # 其餘文字欄位一次取完；作者支援 adv_author 與 /f/author，
+        # 售價依序找 price_box → price_a → 整個 item
+        title, author, publisher, info_text, price_text = [
+            get(item) for get in _EXTRA_FIELDS
+        ]
 
-        # Publisher & pub date from li.info (cebook_new has these)
-        publisher = ""
+        # Pub date from li.info (cebook_new has these)
         pub_date = ""
-        info_li = item.find("li", class_="info")
-        if info_li:
-            pub_link = info_li.find("a", href=re.compile(r"pubid"))
-            if pub_link:
-                publisher = pub_link.get_text(strip=True)
-            info_text = info_li.get_text()
-            m = re.search(r"出版日期：(\d{4}-\d{2}-\d{2})", info_text)
-            if m:
-                pub_date = m.group(1)
+        m = _PUB_DATE_RE.search(info_text)
+        if m:
+            pub_date = m.group(1)
 
-        # Price — try price_box first, then price_a, then whole item
+        # Price
         price = ""
-        price_el = (
-            item.find("div", class_="price_box")
-            or item.find("li", class_="price_a")
-            or item
-        )
-        price_text = price_el.get_text()
-        m = re.search(r"(\d+)\s*折\s*(\d+)\s*元", price_text)
+        m = _DISCOUNT_PRICE_RE.search(price_text)
         if m:
             price = f"{m.group(1)}折 {m.group(2)}元"
         else:
-            m = re.search(r"(\d+)\s*元", price_text)
+            m = _PRICE_RE.search(price_text)
             if m:
                 price = f"{m.group(1)}元"
 
         # Cover image
         image_url = ""
-        img = item.find("img", class_="cover") or item.find("img")
+        img = _COVER_IMG_XP(item)
         if img:
-            image_url = _extract_cover_url(img)
+            image_url = _extract_cover_url(img[0])
 
         books.append(
             Book(
@@ -314,7 +538,7 @@ def scrape_extra_source(name: str, url: str, recent_days: int = 7) -> list[Book]
         log.error("No config for extra source: %s", name)
         return []
     log.info("Fetching extra source %s: %s", name, url)
-    html = fetch_page(url)
+    html = fetch_page(url, expect=cfg["keywords"])
     return _parse_extra_source(
         html,
         category=name,
@@ -324,36 +548,35 @@ def scrape_extra_source(name: str, url: str, recent_days: int = 7) -> list[Book]
     )
 
 
-def scrape_extra_sources(recent_days: int = 7) -> dict[str, list[Book]]:
-    """Scrape all extra sources."""
-    result: dict[str, list[Book]] = {}
-    for name, url in EXTRA_SOURCES.items():
-        try:
-            result[name] = scrape_extra_source(name, url, recent_days=recent_days)
-        except Exception:
-            log.exception("Failed to scrape extra source %s", name)
-            result[name] = []
-        _random_delay()
-    return result
-
-
-
 def scrape_category(code: str, recent_days: int = 7) -> list[Book]:
     """Scrape new books for a single category, filtered to last N days."""
-    name = CATEGORIES.get(code, code)
-    url = NEW_BOOKS_URL_TEMPLATE.format(code=code)
+    return _scrape_category_url(
+        code, CATEGORIES.get(code, code), NEW_BOOKS_URL_TEMPLATE.format(code=code), recent_days
+    )
+
+
+def _scrape_category_url(code: str, name: str, url: str, recent_days: int = 7) -> list[Book]:
+    """同 scrape_category，但分類名稱與網址由呼叫端先算好。"""
     log.info("Fetching category %s (%s): %s", code, name, url)
-    html = fetch_page(url)
-    books = _parse_recent_books(html, category=name)
-    books = _filter_recent(books, days=recent_days)
-    return books
+    html = fetch_page(url, expect=(_RECENT_SECTION_TITLE,))
+    return _filter_recent(_iter_recent_books(html, category=name), days=recent_days)
 
 
 def scrape_preorders() -> list[Book]:
     """Scrape pre-order books (no date filter)."""
     log.info("Fetching pre-orders: %s", PREORDER_URL)
-    html = fetch_page(PREORDER_URL)
-    return _parse_recent_books(html, category="預購書")
+    html = fetch_page(PREORDER_URL, expect=(_RECENT_SECTION_TITLE,))
+    return list(_iter_recent_books(html, category="預購書"))
+
+
+def _run_job(job: tuple[str, Callable[[], list[Book]]]) -> list[Book]:
+    """執行單一爬取工作：失敗時記錄錯誤並回傳空清單，不中斷其他來源。"""
+    name, scrape = job
+    try:
+        return scrape()
+    except Exception:
+        log.exception("Failed to scrape %s", name)
+        return []
 
 
 def scrape_all(
@@ -361,29 +584,34 @@ def scrape_all(
     include_preorders: bool = True,
     include_extra: bool = True,
     recent_days: int = 7,
+    max_workers: int = REQUEST_MAX_WORKERS,
 ) -> dict[str, list[Book]]:
     """Scrape all (or selected) categories, extra sources, and pre-orders."""
     codes = categories or list(CATEGORIES.keys())
     result: dict[str, list[Book]] = {}
 
-    for code in codes:
-        name = CATEGORIES.get(code, code)
-        try:
-            result[name] = scrape_category(code, recent_days=recent_days)
-        except Exception:
-            log.exception("Failed to scrape category %s (%s)", code, name)
-            result[name] = []
-        _random_delay()
-
+    # 每個來源一個工作（名稱, 爬取函式），依分類 → 額外來源 → 預購書的順序排列
+    # 分類名稱與網址只算一次：（代碼, 名稱, 網址）
+    plan = [(code, CATEGORIES.get(code, code), NEW_BOOKS_URL_TEMPLATE.format(code=code)) for code in codes]
+    jobs: list[tuple[str, Callable[[], list[Book]]]] = [
+        (name, partial(_scrape_category_url, code, name, url, recent_days=recent_days))
+        for code, name, url in plan
+    ]
     if include_extra:
-        result.update(scrape_extra_sources(recent_days=recent_days))
-
+        jobs += [
+            (name, partial(scrape_extra_source, name, url, recent_days=recent_days))
+            for name, url in EXTRA_SOURCES.items()
+        ]
     if include_preorders:
-        try:
-            result["預購書"] = scrape_preorders()
-        except Exception:
-            log.exception("Failed to scrape pre-orders")
-            result["預購書"] = []
+        jobs.append(("預購書", scrape_preorders))
+
+    try:
+        # 各來源互不相依，全部丟進同一個執行緒池重疊網路等待；節流由 _download 的 RateLimiter 負責
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for (name, _), books in zip(jobs, executor.map(_run_job, jobs)):
+                result[name] = books
+    finally:
+        close_client()
 
     total = sum(len(v) for v in result.values())
     log.info("Total: %d books across %d categories", total, len(result))